@@ -0,0 +1,62 @@
+"""On-disk cache for API responses."""
+
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Stores response text on disk, one file per request key.
+
+    Entries older than max_age seconds are treated as misses; with no max_age
+    they never expire.
+    """
+
+    def __init__(self, cache_dir: Path, max_age: Optional[float] = None) -> None:
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from everything that determines the response."""
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss."""
+        path = self._get_path(key)
+        try:
+            if self.max_age is not None:
+                if time.time() - path.stat().st_mtime > self.max_age:
+                    return None
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("Failed to read cache entry %s: %s", key, e)
+            return None
+
+    def put(self, key: str, content: str) -> None:
+        """Cache a response. Failures are logged, never raised."""
+        path = self._get_path(key)
+        temp_path = path.with_suffix(".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(content, encoding="utf-8")
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning("Failed to write cache entry %s: %s", key, e)
+
+    def discard(self, key: str) -> None:
+        """Remove a cached response if present."""
+        try:
+            self._get_path(key).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Failed to remove cache entry %s: %s", key, e)
+
+    def _get_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
@@ -1,17 +1,9 @@
 import click
 
-# Pipeline commands
-from .pipeline.assemble.__main__ import main as assemble_main
-from .pipeline.curate.__main__ import main as curate_main
-from .pipeline.generate.__main__ import main as generate_main
-from .pipeline.images.__main__ import main as image_main
-
-# Utility scripts
+# Command implementations are imported inside each command so that running one
+# command (or --help) doesn't pull in openai, spaCy, PIL, tkinter, etc.
 from .scripts.clean import TARGETS
 from .scripts.clean import clean as clean_files
-from .scripts.download_spacy_model import download_spacy_model
-from .scripts.manifest import main as manifest_main
-from .scripts.sanitize import main as sanitize_main
 
 
 @click.group()
@@ -24,6 +16,8 @@ def main() -> None:
 @main.command()
 def download_spacy() -> None:
     """Download required spaCy model"""
+    from .scripts.download_spacy_model import download_spacy_model
+
     download_spacy_model()
 
 
@@ -31,19 +25,23 @@ def download_spacy() -> None:
 @main.command()
 def manifest() -> None:
     """Display the current vocabulary manifest"""
+    from .scripts.manifest import main as manifest_main
+
     manifest_main()
 
 
 @main.command()
 def sanitize() -> None:
     """Sanitize the vocabulary file"""
+    from .scripts.sanitize import main as sanitize_main
+
     sanitize_main()
 
 
 @main.command()
 @click.argument(
     "component",
-    type=click.Choice(list(TARGETS.keys())),
+    type=click.Choice(TARGETS),
 )
 @click.option("--force", "-f", is_flag=True, help="Skip confirmation prompt")
 def clean(component: str, force: bool) -> None:
@@ -60,24 +58,42 @@ def clean(component: str, force: bool) -> None:
 @main.command()
 def curate() -> None:
     """Curate new vocabulary words"""
+    from .pipeline.curate.__main__ import main as curate_main
+
     curate_main()
 
 
 @main.command()
-def generate() -> None:
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Regenerate content instead of reusing cached OpenAI responses",
+)
+def generate(no_cache: bool) -> None:
     """Generate AI content for vocabulary terms"""
-    generate_main()
+    from .pipeline.generate.__main__ import main as generate_main
+
+    generate_main(use_cache=not no_cache)
 
 
 @main.command()
-def images() -> None:
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Search again instead of reusing cached Google search results",
+)
+def images(no_cache: bool) -> None:
     """Select images for vocabulary terms"""
-    image_main()
+    from .pipeline.images.__main__ import main as image_main
+
+    image_main(use_cache=not no_cache)
 
 
 @main.command()
 def assemble() -> None:
     """Assemble Anki deck from processed vocabulary terms"""
+    from .pipeline.assemble.__main__ import main as assemble_main
+
     assemble_main()
 
 
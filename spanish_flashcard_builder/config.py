@@ -1,13 +1,20 @@
 import logging
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv(override=True)
+from spanish_flashcard_builder.exceptions import SpanishFlashcardError
+
+try:
+    # The libyaml-backed loader is much faster when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
 
 PROJECT_ROOT = Path(__file__).parent.parent
 CONFIG_FILENAME = "config.yml"
@@ -27,18 +34,26 @@ GOOGLE = "google"
 IMAGES = "images"
 
 
-class ConfigError(Exception):
+class ConfigError(SpanishFlashcardError):
     """Raised when there's an error in configuration."""
 
     pass
 
 
 # Internal classes and functions
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load environment variables from .env, at most once per process."""
+    load_dotenv(override=True)
+
+
 class _YamlConfig:
     """Internal class to handle YAML configuration loading and access."""
 
     def __init__(self, config_filename: str) -> None:
         self.config: Dict[str, Any] = {}
+        # Every value in the config, keyed by its full key path
+        self._values: Dict[Tuple[str, ...], Any] = {}
         self.load(config_filename)
 
     def load(self, config_file: str) -> None:
@@ -47,19 +62,36 @@ class _YamlConfig:
 
         try:
             with open(config_path) as f:
-                self.config = yaml.safe_load(f)
+                self.config = yaml.load(f, Loader=SafeLoader)
         except (FileNotFoundError, yaml.YAMLError) as e:
-            logging.error(f"Error loading config file at {config_path}:\n{e}")
+            logging.error("Error loading config file at %s:\n%s", config_path, e)
             raise ConfigError(f"Failed to load config: {e}") from e
 
+        self._values.clear()
+        self._index_values((), self.config)
+
+    def _index_values(self, keys: Tuple[str, ...], value: Any) -> None:
+        """Record a value and everything nested under it by key path."""
+        self._values[keys] = value
+        if isinstance(value, dict):
+            for key, child in value.items():
+                self._index_values((*keys, key), child)
+
     def get_value(self, *keys: str, default: Optional[Any] = None) -> Any:
         """Safely get nested config values with optional default."""
-        value = self.config
-        for key in keys[:-1]:  # All but last key
-            if not isinstance(value, dict):
-                raise ConfigError(f"Expected dict at key '{key}', got {type(value)}")
-            value = value.get(key, {})
-        return value.get(keys[-1], default) if keys else value
+        if keys in self._values:
+            return self._values[keys]
+
+        # Missing key: make sure the path didn't run through a non-dict value
+        for depth in range(len(keys) - 1, 0, -1):
+            if keys[:depth] in self._values:
+                parent = self._values[keys[:depth]]
+                if not isinstance(parent, dict):
+                    raise ConfigError(
+                        f"Expected dict at key '{keys[depth]}', got {type(parent)}"
+                    )
+                break
+        return default
 
     def get_path(self, *keys: str) -> Path:
         """Get a path value from config, joining with PROJECT_ROOT."""
@@ -85,22 +117,27 @@ class _Paths:
 
     def __init__(self) -> None:
         # Data paths
+        data = config.get_value(PATHS, DATA)
         self.data_dir = config.get_path(PATHS, DATA, DIR)
         self._ensure_dir(self.data_dir)
-        self.raw_vocab = self.data_dir / config.get_value(PATHS, DATA, "raw_vocab")
-        self.sanitized_vocab = self.data_dir / config.get_value(
-            PATHS, DATA, "sanitized_vocab"
+        self.raw_vocab = self.data_dir / data["raw_vocab"]
+        self.sanitized_vocab = self.data_dir / data["sanitized_vocab"]
+        self.curator_history = self.data_dir / data["curator_history"]
+        # Added after the first release, so older config files may not set them
+        self.generation_cache = self.data_dir / data.get(
+            "generation_cache", "generation_cache"
         )
-        self.curator_history = self.data_dir / config.get_value(
-            PATHS, DATA, "curator_history"
+        self.image_search_cache = self.data_dir / data.get(
+            "image_search_cache", "image_search_cache"
         )
 
         # Output paths
+        output = config.get_value(PATHS, OUTPUT)
         self.output_dir = config.get_path(PATHS, OUTPUT, DIR)
         self._ensure_dir(self.output_dir)
-        self.terms_dir = self.output_dir / config.get_value(PATHS, OUTPUT, TERMS, DIR)
+        self.terms_dir = self.output_dir / output[TERMS][DIR]
         self._ensure_dir(self.terms_dir)
-        self.deck_file = self.output_dir / config.get_value(PATHS, OUTPUT, "deck")
+        self.deck_file = self.output_dir / output["deck"]
 
         self.dictionary_entry_filename = "dictionary_entry.json"
         self.flashcard_filename = "flashcard.json"
@@ -114,44 +151,130 @@ class _Paths:
         return f"{term_dir.name}.png"
 
 
+# Validation rules for a settings class: a check on an instance, and the error
+# message (formatted with the instance) raised when it fails
+_Rules = Tuple[Tuple[Callable[[Any], bool], str], ...]
+
+
+def _check_rules(settings: Any, rules: _Rules) -> None:
+    """Raise ConfigError for the first rule the settings fail."""
+    for is_valid, message in rules:
+        if not is_valid(settings):
+            raise ConfigError(message.format(settings))
+
+
+@dataclass(frozen=True, slots=True)
 class _Image:
     """Image configuration."""
 
-    max_dimension: int = config.get_value(IMAGES, "max_dimension")
+    max_dimension: int
+
+    _RULES: ClassVar[_Rules] = (
+        (
+            lambda s: isinstance(s.max_dimension, int) and s.max_dimension > 0,
+            "Max image dimension must be a positive integer, got {0.max_dimension}",
+        ),
+    )
 
+    @classmethod
+    def load(cls) -> "_Image":
+        """Read image settings from the config file."""
+        return cls(max_dimension=config.get_value(IMAGES, "max_dimension"))
 
+    def __post_init__(self) -> None:
+        _check_rules(self, self._RULES)
+
+
+@dataclass(frozen=True, slots=True)
 class _Anki:
     """Anki deck configuration."""
 
-    deck_filename: str = config.get_value(ANKI, ANKI_DECK, "filename")
-    deck_name: str = config.get_value(ANKI, ANKI_DECK, "name")
-    deck_id: int = config.get_value(ANKI, ANKI_DECK, "id")
-    model_id: int = config.get_value(ANKI, "model_id")
+    deck_filename: str
+    deck_name: str
+    deck_id: int
+    model_id: int
+
+    _RULES: ClassVar[_Rules] = (
+        (lambda s: bool(s.deck_name), "Anki deck name cannot be empty"),
+        (
+            lambda s: isinstance(s.deck_id, int) and s.deck_id > 0,
+            "Anki deck ID must be a positive integer, got {0.deck_id}",
+        ),
+        (
+            lambda s: isinstance(s.model_id, int) and s.model_id > 0,
+            "Anki model ID must be a positive integer, got {0.model_id}",
+        ),
+    )
+
+    @classmethod
+    def load(cls) -> "_Anki":
+        """Read Anki settings from the config file."""
+        deck = config.get_value(ANKI, ANKI_DECK)
+        return cls(
+            deck_filename=deck["filename"],
+            deck_name=deck["name"],
+            deck_id=deck["id"],
+            model_id=config.get_value(ANKI, "model_id"),
+        )
 
+    def __post_init__(self) -> None:
+        _check_rules(self, self._RULES)
 
+
+@dataclass(frozen=True, slots=True)
 class _Spacy:
     """SpaCy model configuration."""
 
-    def __init__(self) -> None:
-        self.model_name: str = config.get_value(SPACY, "model_name")
+    model_name: str
 
+    @classmethod
+    def load(cls) -> "_Spacy":
+        """Read spaCy settings from the config file."""
+        return cls(model_name=config.get_value(SPACY, "model_name"))
 
+
+@dataclass(frozen=True, slots=True)
 class _OpenAI:
     """OpenAI API configuration."""
 
-    def __init__(self) -> None:
-        self.model: str = config.get_value(OPENAI, "model")
-        self.temperature: float = config.get_value(OPENAI, "temperature")
-        self.validate()
+    model: str
+    temperature: float
+    max_concurrent_requests: int
+    max_retries: int
+
+    _RULES: ClassVar[_Rules] = (
+        (
+            lambda s: isinstance(s.temperature, (int, float))
+            and 0 <= s.temperature <= 1,
+            "OpenAI temperature must be between 0 and 1, got {0.temperature}",
+        ),
+        (lambda s: bool(s.model), "OpenAI model name cannot be empty"),
+        (
+            lambda s: isinstance(s.max_concurrent_requests, int)
+            and s.max_concurrent_requests >= 1,
+            "OpenAI max_concurrent_requests must be an integer of at least 1, "
+            "got {0.max_concurrent_requests}",
+        ),
+        (
+            lambda s: isinstance(s.max_retries, int) and s.max_retries >= 0,
+            "OpenAI max_retries must be a non-negative integer, got {0.max_retries}",
+        ),
+    )
+
+    @classmethod
+    def load(cls) -> "_OpenAI":
+        """Read OpenAI settings from the config file."""
+        settings = config.get_value(OPENAI)
+        return cls(
+            model=settings["model"],
+            temperature=settings["temperature"],
+            # Added after the first release, so older config files may not set them
+            max_concurrent_requests=settings.get("max_concurrent_requests", 4),
+            max_retries=settings.get("max_retries", 5),
+        )
 
-    def validate(self) -> None:
-        """Validate OpenAI configuration values."""
-        if not 0 <= self.temperature <= 1:
-            raise ConfigError(
-                f"OpenAI temperature must be between 0 and 1, got {self.temperature}"
-            )
-        if not self.model:
-            raise ConfigError("OpenAI model name cannot be empty")
+    def __post_init__(self) -> None:
+        _check_rules(self, self._RULES)
 
 
 class _Keys:
@@ -169,6 +292,7 @@ class _Keys:
 
     def _init_keys(self) -> None:
         """Initialize and validate API keys from environment variables."""
+        _load_env()
         self.merriam_webster = self._get_required_key("MERRIAM_WEBSTER_API_KEY")
         self.openai = self._get_required_key("OPENAI_API_KEY")
         self.google_search = self._get_required_key("GOOGLE_API_KEY")
@@ -183,10 +307,28 @@ class _Keys:
         return key
 
 
-# Configuration instances for external use
-paths = _Paths()
-api_keys = _Keys()
-spacy_config = _Spacy()
-openai_config = _OpenAI()
-image_config = _Image()
-anki_config = _Anki()
+# Configuration instances for external use. Each is created on first access, so
+# commands only create directories and check API keys for what they use.
+paths: _Paths
+api_keys: _Keys
+spacy_config: _Spacy
+openai_config: _OpenAI
+image_config: _Image
+anki_config: _Anki
+
+_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "paths": _Paths,
+    "api_keys": _Keys,
+    "spacy_config": _Spacy.load,
+    "openai_config": _OpenAI.load,
+    "image_config": _Image.load,
+    "anki_config": _Anki.load,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Create a configuration instance the first time it's accessed."""
+    if (factory := _FACTORIES.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = factory()
+    return value
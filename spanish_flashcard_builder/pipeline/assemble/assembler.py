@@ -1,5 +1,7 @@
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -16,33 +18,45 @@ logger = logging.getLogger(__name__)
 class AnkiDeckAssembler:
     """Assembles an Anki deck from vocabulary terms."""
 
+    # Term files are small, so building notes is dominated by file I/O
+    MAX_BUILD_WORKERS = 16
+
     def __init__(self, deck_name: str, deck_id: int):
         self.deck = genanki.Deck(deck_id, deck_name)
         self.note_factory = AnkiNoteFactory()
 
     def assemble(self) -> None:
         """Assembles the Anki deck package."""
-        terms_dir = Path(paths.terms_dir)
+        with os.scandir(paths.terms_dir) as entries:
+            term_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
 
-        for term_dir in terms_dir.iterdir():
-            if not term_dir.is_dir():
-                continue
+        # Build notes in parallel; they are added to the deck in this thread
+        with ThreadPoolExecutor(max_workers=self.MAX_BUILD_WORKERS) as executor:
+            notes = list(executor.map(self._build_note, term_dirs))
 
-            try:
-                if term_data := self._load_term_data(term_dir):
-                    note = self.note_factory.create_note(term_dir, term_data)
-                    self.deck.add_note(note)
-            except Exception as e:
-                logger.error(f"Failed to process {term_dir}: {e}")
+        for note in notes:
+            if note is not None:
+                self.deck.add_note(note)
 
         self._save_deck()
 
+    def _build_note(self, term_dir: Path) -> Optional[genanki.Note]:
+        """Load a term and create its note, logging any failure."""
+        term_data = self._load_term_data(term_dir)
+        if not term_data:
+            return None
+        try:
+            return self.note_factory.create_note(term_dir, term_data)
+        except Exception as e:
+            logger.error("Failed to process %s: %s", term_dir, e)
+            return None
+
     def _save_deck(self) -> None:
         """Save the deck with media files."""
         package = genanki.Package(self.deck)
         package.media_files = self.note_factory.media_files
         package.write_to_file(str(paths.deck_file))
-        logger.info(f"Generated deck at {paths.deck_file}")
+        logger.info("Generated deck at %s", paths.deck_file)
 
     @staticmethod
     def _load_term_data(term_dir: Path) -> Optional[GeneratedTerm]:
@@ -50,8 +64,8 @@ class AnkiDeckAssembler:
         try:
             term_path = term_dir / paths.flashcard_filename
             if term_path.exists():
-                return GeneratedTerm(**json.loads(term_path.read_text()))
+                return GeneratedTerm.from_dict(json.loads(term_path.read_text()))
         except Exception as e:
-            logger.error(f"Failed to load term data at {term_dir}: {e}")
+            logger.error("Failed to load term data at %s: %s", term_dir, e)
 
         return None
@@ -1,7 +1,7 @@
 """Models for Anki note generation."""
 
-import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -17,19 +17,32 @@ ExampleSentence = Tuple[str, str]  # (Spanish, English)
 SPANISH_MODEL_ID = anki_config.model_id
 
 # Template setup
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+# Templates don't change during a run, so skip reload checks and never evict
 env = Environment(
-    loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), "templates"))
+    loader=FileSystemLoader(TEMPLATES_DIR), auto_reload=False, cache_size=-1
 )
 
 
+@lru_cache(maxsize=None)
+def _get_template(template_name: str) -> Template:
+    """Get a compiled template, looking it up in the environment only once."""
+    return env.get_template(template_name)
+
+
 def render_template(template_name: str, context: Dict[str, Any]) -> str:
     """Render a template with given context."""
-    template: Template = env.get_template(template_name)
-    rendered: str = template.render(**context)
+    rendered: str = _get_template(template_name).render(**context)
     return rendered
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=None)
+def _read_template_file(filename: str) -> str:
+    """Read a static card template or stylesheet, once per process."""
+    return (TEMPLATES_DIR / filename).read_text(encoding="utf-8")
+
+
+@dataclass(frozen=True, slots=True)
 class NoteData:
     """A Spanish vocabulary note."""
 
@@ -38,8 +51,8 @@ class NoteData:
     part_of_speech: str
     gender: Optional[str]
     example_sentences: List[ExampleSentence]
-    image_path: Optional[Path]
-    audio_path: Optional[Path]
+    image_filename: Optional[str]
+    audio_filename: Optional[str]
     frequency_rating: int
     guid: str
     sort_key: str
@@ -52,8 +65,8 @@ class NoteData:
             self.part_of_speech,
             self.definitions,
             self._format_sentences(),
-            f'<img src="{self.image_path.name}">' if self.image_path else "",
-            f"[sound:{self.audio_path.name}]" if self.audio_path else "",
+            f'<img src="{self.image_filename}">' if self.image_filename else "",
+            f"[sound:{self.audio_filename}]" if self.audio_filename else "",
             str(self.frequency_rating),
             self.guid,
             self.sort_key,
@@ -61,6 +74,9 @@ class NoteData:
 
     def _format_sentences(self) -> str:
         """Format example sentences with template."""
+        # An empty list renders to an empty <ul>, so skip the template entirely
+        if not self.example_sentences:
+            return ""
         return render_template(
             "example_sentences.html",
             {
@@ -88,21 +104,20 @@ class SpanishVocabModel(genanki.Model):
             {"name": "SortKey"},
         ]
 
-        template_dir = Path(__file__).parent / "templates"
         templates = [
             {
                 "name": "Spanish -> English",
-                "qfmt": (template_dir / "spanish_to_english_front.html").read_text(),
-                "afmt": (template_dir / "spanish_to_english_back.html").read_text(),
+                "qfmt": _read_template_file("spanish_to_english_front.html"),
+                "afmt": _read_template_file("spanish_to_english_back.html"),
             },
             {
                 "name": "English -> Spanish",
-                "qfmt": (template_dir / "english_to_spanish_front.html").read_text(),
-                "afmt": (template_dir / "english_to_spanish_back.html").read_text(),
+                "qfmt": _read_template_file("english_to_spanish_front.html"),
+                "afmt": _read_template_file("english_to_spanish_back.html"),
             },
         ]
 
-        css = (template_dir / "spanish_vocab.css").read_text()
+        css = _read_template_file("spanish_vocab.css")
 
         super().__init__(
             model_id=SPANISH_MODEL_ID,
@@ -1,15 +1,22 @@
 """Factory for creating Anki notes."""
 
+import os
+import threading
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 
 import genanki
 
+from spanish_flashcard_builder.config import paths
 from spanish_flashcard_builder.exceptions import SpanishFlashcardError
 from spanish_flashcard_builder.pipeline.generate.models import GeneratedTerm
 
 from .models import NoteData, SpanishVocabModel
 
+# Pulls the (Spanish, English) pair out of a generated example sentence
+_get_sentence_pair = itemgetter("es", "en")
+
 
 class MediaProcessingError(SpanishFlashcardError):
     """Raised when processing media files fails."""
@@ -23,6 +30,8 @@ class AnkiNoteFactory:
     def __init__(self) -> None:
         self.model = SpanishVocabModel()
         self.media_files: List[str] = []
+        # create_note may be called from several threads at once
+        self._media_lock = threading.Lock()
 
     def create_note(self, term_dir: Path, term: GeneratedTerm) -> genanki.Note:
         """Create an Anki note from a term.
@@ -37,16 +46,17 @@ class AnkiNoteFactory:
         Raises:
             MediaProcessingError: If media files are missing or invalid
         """
-        image_path = self._get_image_path(term_dir)
-        audio_path = self._get_audio_path(term_dir)
-        if image_path is not None:
-            self.media_files.append(str(image_path))
-        if audio_path is not None:
-            self.media_files.append(str(audio_path))
-
-        example_sentences = [
-            (example["es"], example["en"]) for example in term.example_sentences
-        ]
+        # One directory listing covers both media checks
+        term_files = set(os.listdir(term_dir))
+        image_path = self._get_image_path(term_dir, term_files)
+        audio_path = self._get_audio_path(term_dir, term_files)
+        with self._media_lock:
+            if image_path is not None:
+                self.media_files.append(str(image_path))
+            if audio_path is not None:
+                self.media_files.append(str(audio_path))
+
+        example_sentences = list(map(_get_sentence_pair, term.example_sentences))
 
         note_data = NoteData(
             term=term.term,
@@ -54,8 +64,8 @@ class AnkiNoteFactory:
             part_of_speech=term.part_of_speech,
             gender=term.gender,
             example_sentences=example_sentences,
-            image_path=Path(image_path.name) if image_path else None,
-            audio_path=Path(audio_path.name) if audio_path else None,
+            image_filename=image_path.name if image_path else None,
+            audio_filename=audio_path.name if audio_path else None,
             frequency_rating=term.frequency_rating,
             guid=term_dir.name,
             sort_key=f"{(10 - term.frequency_rating)}-{term_dir.name.lower()}",
@@ -67,18 +77,18 @@ class AnkiNoteFactory:
             guid=term_dir.name,
         )
 
-    def _get_image_path(self, term_dir: Path) -> Optional[Path]:
+    def _get_image_path(self, term_dir: Path, term_files: Set[str]) -> Optional[Path]:
         """Get and validate image path."""
-        image_path = term_dir / (term_dir.name + ".png")
-        if not image_path.exists():
+        image_filename = paths.get_image_filename(term_dir)
+        if image_filename not in term_files:
             return None
 
-        return image_path
+        return term_dir / image_filename
 
-    def _get_audio_path(self, term_dir: Path) -> Optional[Path]:
+    def _get_audio_path(self, term_dir: Path, term_files: Set[str]) -> Optional[Path]:
         """Get and validate audio path."""
-        audio_path = term_dir / (term_dir.name + ".mp3")
-        if not audio_path.exists():
+        audio_filename = paths.get_pronunciation_filename(term_dir)
+        if audio_filename not in term_files:
             return None
 
-        return audio_path
+        return term_dir / audio_filename
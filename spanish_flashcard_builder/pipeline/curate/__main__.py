@@ -19,17 +19,18 @@ def main() -> None:
     vocab_bank = VocabBank(paths.terms_dir)
     state = State()
 
-    all_commands = [
+    all_commands = (
         AcceptCommand,
         RejectCommand,
         UndoCommand,
         QuitCommand,
-    ]
+    )
 
     with state:  # Use context manager to ensure state is saved
         while True:
             handle_command_input(
                 state.current_entry(),
+                state.current_entry_index(),
                 state.current_term(),
                 all_commands,
                 vocab_bank,
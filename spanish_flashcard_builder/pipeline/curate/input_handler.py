@@ -1,4 +1,5 @@
-from typing import List, Type
+from functools import lru_cache
+from typing import Tuple, Type
 
 from spanish_flashcard_builder.utils import get_key_press
 
@@ -9,16 +10,18 @@ from .state import State
 from .vocab_bank import VocabBank
 
 
-def format_help_text(commands: List[Type[Command]]) -> str:
-    """Formats help text for a list of commands."""
+@lru_cache(maxsize=None)
+def format_help_text(commands: Tuple[Type[Command], ...]) -> str:
+    """Formats help text for a set of commands."""
 
     return ", ".join(f"{cmd.key}={cmd.help_text}" for cmd in commands)
 
 
 def handle_command_input(
     entry: DictionaryEntry,
+    entry_index: int,
     word: DictionaryTerm,
-    commands: List[Type[Command]],
+    commands: Tuple[Type[Command], ...],
     vocab_bank: VocabBank,
     state: State,
 ) -> None:
@@ -28,18 +31,20 @@ def handle_command_input(
 
     total_entries = len(word.entries)
     if len(word.entries) > 1:
-        current_entry_idx = word.entries.index(entry) + 1
-        print(f"[Meaning {current_entry_idx} of {total_entries}]")
+        print(f"[Meaning {entry_index + 1} of {total_entries}]")
+
+    help_text = format_help_text(commands)
+    commands_by_key = {cmd.key: cmd for cmd in commands}
 
     print("\nDo you want to learn this word?")
-    print(f"({format_help_text(commands)})")
+    print(f"({help_text})")
 
     while True:
         choice = get_key_press()
-        matching_command = next((cmd for cmd in commands if cmd.key == choice), None)
+        matching_command = commands_by_key.get(choice)
 
         if matching_command is None:
-            print(f"Invalid input. Available commands: {format_help_text(commands)}")
+            print(f"Invalid input. Available commands: {help_text}")
             continue
 
         command = matching_command(entry, vocab_bank, state, word)
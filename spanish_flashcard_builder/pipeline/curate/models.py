@@ -12,6 +12,8 @@ class DictionaryTerm:
 class DictionaryEntry:
     """Represents a single dictionary entry from Merriam-Webster."""
 
+    __slots__ = ("id", "headword", "part_of_speech", "definitions", "raw_data")
+
     def __init__(self, raw_entry: Dict) -> None:
         self.id = raw_entry["meta"]["id"]
         self.headword = raw_entry.get("hwi", {}).get("hw", "").replace("*", "")
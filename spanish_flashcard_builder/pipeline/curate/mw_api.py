@@ -1,4 +1,5 @@
 import json
+import os
 import string
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -9,13 +10,23 @@ from spanish_flashcard_builder.config import api_keys, paths
 
 from .models import DictionaryEntry, DictionaryTerm
 
+REQUEST_TIMEOUT = 10  # seconds
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Audio files starting with one of these are stored in the "number" subdirectory
+_NUMBER_SUBDIRECTORY_CHARS = frozenset(string.digits + string.punctuation)
+
+# Shared so lookups and audio downloads reuse connections instead of paying for
+# a new TCP and TLS handshake on every request
+_session = requests.Session()
+
 
 def _fetch_mw_data(word: str) -> Optional[List[Dict[str, Any]]]:
     """Fetches data from the Merriam-Webster API for a given word."""
 
     api_url = f"https://www.dictionaryapi.com/api/v3/references/spanish/json/{word}?key={api_keys.merriam_webster}"
     try:
-        response = requests.get(api_url)
+        response = _session.get(api_url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         data = response.json()
         if not isinstance(data, list):
@@ -34,15 +45,16 @@ def look_up(search_word: str) -> Optional[DictionaryTerm]:
 
     matching_entries = []
     for entry in data:
-        if isinstance(entry, dict):
-            if entry.get("meta", {}).get("lang") != "es":
+        try:
+            if entry["meta"]["lang"] != "es":
                 continue
+            headword = entry["hwi"]["hw"].replace("*", "")
+        except (KeyError, TypeError):
+            # Malformed entry, or a spelling suggestion (plain string)
+            continue
 
-            headword = entry.get("hwi", {}).get("hw", "").replace("*", "")
-
-            if search_word == headword:
-                if entry.get("fl") and entry.get("shortdef"):
-                    matching_entries.append(entry)
+        if search_word == headword and entry.get("fl") and entry.get("shortdef"):
+            matching_entries.append(entry)
 
     if not matching_entries:
         return None
@@ -67,7 +79,7 @@ def _extract_audio_url(mw_data: Dict) -> Optional[str]:
                     subdirectory = "bix"
                 elif audio.startswith("gg"):
                     subdirectory = "gg"
-                elif audio[0].isdigit() or audio[0] in string.punctuation:
+                elif audio[0] in _NUMBER_SUBDIRECTORY_CHARS:
                     subdirectory = "number"
                 else:
                     subdirectory = audio[0]
@@ -83,15 +95,20 @@ def download_audio(entry: DictionaryEntry, folder: str) -> None:
     if not audio_url:
         print(f"No audio found for {word}.")
         return
+    folder_path = Path(folder)
+    audio_path = folder_path / paths.get_pronunciation_filename(folder_path)
+    # Stream to a temporary file so a failed download doesn't leave a partial MP3
+    temp_path = audio_path.with_suffix(".tmp")
     try:
-        response = requests.get(audio_url)
-        response.raise_for_status()
-        folder_path = Path(folder)
-        audio_path = folder_path / paths.get_pronunciation_filename(folder_path)
-        with open(audio_path, "wb") as f:
-            f.write(response.content)
+        with _session.get(audio_url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            with open(temp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        os.replace(temp_path, audio_path)
         print(f"Downloaded audio for '{word}'")
     except requests.RequestException as e:
+        temp_path.unlink(missing_ok=True)
         print(f"Error downloading audio for '{word}': {e}")
 
 
@@ -1,22 +1,24 @@
 import json
 import logging
 import os
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Set
 
 from spanish_flashcard_builder.config import paths
+from spanish_flashcard_builder.exceptions import SpanishFlashcardError
 
 from .models import DictionaryEntry, DictionaryTerm
 from .mw_api import look_up
 
 
-class CurationError(Exception):
+class CurationError(SpanishFlashcardError):
     """Raised when curation state becomes invalid"""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class _StateData:
     headword_index: int = 0
     entry_index: int = 0
@@ -24,15 +26,33 @@ class _StateData:
 
 
 class State:
+    # Upcoming headwords looked up in the background, so skipping words without
+    # entries doesn't wait on one API round trip per word
+    PREFETCH_WINDOW = 16
+    MAX_PREFETCH_WORKERS = 8
+
     def __init__(self) -> None:
         self._headwords: List[str] = self._load_headword_list()
         self._data: _StateData = _StateData()
         self._lookup_cache: Dict[str, DictionaryTerm] = {}
+        # Headwords whose lookup came back empty, so undo doesn't query them again
+        self._missing_headwords: Set[str] = set()
+        self._pending_lookups: Dict[str, Future[Optional[DictionaryTerm]]] = {}
+        self._prefetch_executor = ThreadPoolExecutor(
+            max_workers=self.MAX_PREFETCH_WORKERS
+        )
+        # Last payload written to (or read from) disk, to skip no-op saves
+        self._saved_history: Optional[str] = None
         self._load_history()
-        self._ensure_valid_state()
+        try:
+            self._ensure_valid_state()
+        except CurationError:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     def _ensure_valid_state(self) -> None:
         """Ensures current state points to valid entries"""
+        self._prefetch_lookups()
         while not self._get_term_for_headword(self._current_word()):
             if not self._go_to_next_headword():
                 raise CurationError("No headwords with entries found!")
@@ -64,6 +84,9 @@ class State:
                 for '{term.headword}'
             """) from e
 
+    def current_entry_index(self) -> int:
+        return self._data.entry_index
+
     def commit_entry(self) -> None:
         self._data.entry_index += 1
         current_word = self.current_term().headword
@@ -90,17 +113,36 @@ class State:
     def _get_term_for_headword(self, word: str) -> Optional[DictionaryTerm]:
         if word in self._lookup_cache:
             return self._lookup_cache[word]
+        if word in self._missing_headwords:
+            return None
 
         try:
-            term = look_up(word)
-            if term and term.entries:
-                self._lookup_cache[word] = term
-                self._data.headword_entry_count[word] = len(term.entries)
-                return term
+            pending = self._pending_lookups.pop(word, None)
+            term = pending.result() if pending else look_up(word)
         except Exception as e:
-            logging.error(f"Error looking up word '{word}': {e}")
+            # Possibly transient, so leave the word to be looked up again
+            logging.error("Error looking up word '%s': %s", word, e)
+            return None
+
+        if term and term.entries:
+            self._lookup_cache[word] = term
+            self._data.headword_entry_count[word] = len(term.entries)
+            return term
+        self._missing_headwords.add(word)
         return None
 
+    def _prefetch_lookups(self) -> None:
+        """Starts lookups for the headwords following the current one"""
+        start = self._data.headword_index
+        for word in self._headwords[start : start + self.PREFETCH_WINDOW]:
+            if (
+                word not in self._lookup_cache
+                and word not in self._missing_headwords
+                and word not in self._pending_lookups
+            ):
+                future = self._prefetch_executor.submit(look_up, word)
+                self._pending_lookups[word] = future
+
     def _advance_headword(self, step: int) -> bool:
         while True:
             new_index = self._data.headword_index + step
@@ -109,6 +151,7 @@ class State:
 
             self._data.headword_index = new_index
             self._data.entry_index = 0
+            self._prefetch_lookups()
             word = self._current_word()
 
             if self._get_term_for_headword(word):
@@ -133,15 +176,27 @@ class State:
         try:
             with open(paths.curator_history, "r", encoding="utf-8") as f:
                 self._data = _StateData(**json.load(f))
+            self._saved_history = self._serialize_history()
         except Exception as e:
-            logging.error(f"Error loading history: {e}")
+            logging.error("Error loading history: %s", e)
+
+    def _serialize_history(self) -> str:
+        return json.dumps(asdict(self._data), indent=2)
 
     def _save_history(self) -> None:
+        content = self._serialize_history()
+        if content == self._saved_history:
+            return
+        # Write to a temporary file first so an interrupted save can't corrupt
+        # the existing history
+        temp_path = paths.curator_history.with_suffix(".tmp")
         try:
-            with open(paths.curator_history, "w", encoding="utf-8") as f:
-                json.dump(self._data.__dict__, f, indent=2)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(temp_path, paths.curator_history)
+            self._saved_history = content
         except IOError as e:
-            logging.error(f"Error saving history: {e}")
+            logging.error("Error saving history: %s", e)
 
     def __enter__(self) -> "State":
         return self
@@ -152,4 +207,5 @@ class State:
         exc_val: Optional[Exception],
         exc_tb: Optional[object],
     ) -> None:
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
         self._save_history()
@@ -27,10 +27,13 @@ class VocabBank:
         os.makedirs(entry_dir, exist_ok=True)
 
         print(f"Saving entry '{entry.id}'")
-        with open(os.path.join(entry_dir, paths.dictionary_entry_filename), "w") as f:
-            json.dump(entry.raw_data, f, indent=2)
+        entry_path = os.path.join(entry_dir, paths.dictionary_entry_filename)
+        # Serialize up front so the entry goes out in a single write
+        content = json.dumps(entry.raw_data, indent=2)
+        with open(entry_path, "w", encoding="utf-8") as f:
+            f.write(content)
 
-            download_audio(entry, entry_dir)
+        download_audio(entry, entry_dir)
 
     def delete_entry(self, entry_id: str) -> None:
         """Removes all saved data for an entry."""
@@ -38,11 +41,11 @@ class VocabBank:
         if os.path.exists(entry_dir):
             try:
                 shutil.rmtree(entry_dir)
-                logging.info(f"Deleted folder for entry '{entry_id}'")
+                logging.info("Deleted folder for entry '%s'", entry_id)
             except Exception as e:
-                logging.error(f"Error deleting folder for entry '{entry_id}': {e}")
+                logging.error("Error deleting folder for entry '%s': %s", entry_id, e)
         else:
-            logging.warning(f"Entry directory '{entry_dir}' does not exist.")
+            logging.warning("Entry directory '%s' does not exist.", entry_dir)
 
     def _get_entry_path(self, entry_id: str) -> str:
         """Get directory path for a dictionary entry."""
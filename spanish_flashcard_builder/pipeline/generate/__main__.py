@@ -1,9 +1,9 @@
 from .generator import ContentGenerator
 
 
-def main() -> None:
+def main(use_cache: bool = True) -> None:
     """Main entry point for content generation."""
-    generator = ContentGenerator()
+    generator = ContentGenerator(use_cache=use_cache)
     if not generator.process_all_pending():
         print("No terms to process")
 
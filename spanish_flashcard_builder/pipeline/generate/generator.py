@@ -2,15 +2,18 @@
 
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
-from spanish_flashcard_builder.config import paths
+from spanish_flashcard_builder.cache import ResponseCache
+from spanish_flashcard_builder.config import openai_config, paths
 from spanish_flashcard_builder.exceptions import SpanishFlashcardError
 
 from .openai_api import OpenAIClient
 from .persistence import ContentPersistence
-from .reviewer import ContentReviewer
+from .reviewer import ContentEditError, ContentReviewer
 
 logger = logging.getLogger(__name__)
 
@@ -24,32 +27,59 @@ class ContentGenerationError(SpanishFlashcardError):
 class ContentGenerator:
     """Generates AI content for vocabulary terms."""
 
-    def __init__(self) -> None:
+    def __init__(self, use_cache: bool = True) -> None:
+        self.use_cache = use_cache
         self.openai_client = OpenAIClient()
         self.persistence = ContentPersistence()
         self.reviewer = ContentReviewer()
+        # Holds generated content until it has been reviewed, so an interrupted
+        # run doesn't pay for the same OpenAI requests again
+        self.cache = ResponseCache(paths.generation_cache)
 
     def process_all_pending(self) -> bool:
-        """Generate content for all pending vocabulary words."""
+        """Generate content for all pending vocabulary words.
+
+        OpenAI requests are issued concurrently in the background, while the
+        generated content is reviewed and saved one word at a time, in order.
+        """
         terms_dir = Path(paths.terms_dir)
         if not terms_dir.exists():
-            logger.error(f"Terms directory not found: {terms_dir}")
+            logger.error("Terms directory not found: %s", terms_dir)
             return False
 
+        pending_folders = self._get_pending_folders(terms_dir)
         words_processed = False
-        for folder_path in self._get_pending_folders(terms_dir):
-            logger.info(f"Generating content for: {folder_path.name}")
+        with ThreadPoolExecutor(
+            max_workers=openai_config.max_concurrent_requests
+        ) as executor:
+            futures = [
+                executor.submit(self._generate_content, folder_path)
+                for folder_path in pending_folders
+            ]
             try:
-                words_processed |= self.generate_word(folder_path)
-            except ContentGenerationError as e:
-                logger.error(f"Failed to generate content for {folder_path}: {e}")
-                continue
+                for folder_path, future in zip(pending_folders, futures, strict=True):
+                    logger.info("Generating content for: %s", folder_path.name)
+                    print(f"Generating content for '{folder_path.name}'...")
+                    try:
+                        cache_key, term_dict = future.result()
+                        words_processed |= self._review_and_save(
+                            folder_path, cache_key, term_dict
+                        )
+                    except ContentGenerationError as e:
+                        logger.error(
+                            "Failed to generate content for %s: %s", folder_path, e
+                        )
+            finally:
+                # Don't keep spending API calls if the user bails out mid-review
+                executor.shutdown(cancel_futures=True)
 
         return words_processed
 
-    def generate_word(self, folder_path: Path) -> bool:
-        """Generate content for a single vocabulary word."""
-        print(f"Generating content for '{folder_path.name}'...")
+    def _generate_content(self, folder_path: Path) -> Tuple[str, Dict[str, Any]]:
+        """Generate content for a word from its dictionary entry.
+
+        Returns the request's cache key along with the generated content.
+        """
         try:
             dict_file = folder_path / paths.dictionary_entry_filename
             with open(dict_file, encoding="utf-8") as f:
@@ -64,15 +94,26 @@ class ContentGenerator:
                     f"Missing required field in dictionary data: {e}"
                 ) from e
 
+            cache_key = self.openai_client.request_key(
+                word, part_of_speech, definitions
+            )
+            if self.use_cache and (cached := self.cache.get(cache_key)):
+                try:
+                    cached_dict: Dict[str, Any] = json.loads(cached)
+                    logger.info("Using cached content for '%s'", folder_path.name)
+                    return cache_key, cached_dict
+                except json.JSONDecodeError:
+                    logger.warning(
+                        "Discarding corrupt cached content for '%s'", folder_path.name
+                    )
+                    self.cache.discard(cache_key)
+
             generated_data = self.openai_client.generate_term(
                 word, part_of_speech, definitions
             )
             term_dict = generated_data.to_dict()
-
-            if not self.reviewer.review_content(term_dict):
-                return False
-
-            return self.persistence.save_content(folder_path, term_dict)
+            self.cache.put(cache_key, json.dumps(term_dict, ensure_ascii=False))
+            return cache_key, term_dict
 
         except json.JSONDecodeError as e:
             raise ContentGenerationError(f"Invalid JSON in dictionary file: {e}") from e
@@ -81,13 +122,41 @@ class ContentGenerator:
                 f"Dictionary file not found: {dict_file}"
             ) from e
         except Exception as e:
-            logger.exception(f"Unexpected error generating content for '{folder_path}'")
+            logger.exception(
+                "Unexpected error generating content for '%s'", folder_path
+            )
+            raise ContentGenerationError(str(e)) from e
+
+    def _review_and_save(
+        self, folder_path: Path, cache_key: str, term_dict: Dict[str, Any]
+    ) -> bool:
+        """Let the user review generated content, then save it if accepted."""
+        try:
+            reviewed_dict = self.reviewer.review_content(term_dict)
+            if reviewed_dict is None:
+                # Rejected content shouldn't come back on the next run
+                self.cache.discard(cache_key)
+                return False
+
+            saved = self.persistence.save_content(folder_path, reviewed_dict)
+            self.cache.discard(cache_key)
+            return saved
+
+        except ContentEditError as e:
+            # The content is still good, so keep it cached for the next run
+            logger.error("Failed to edit content for '%s': %s", folder_path.name, e)
+            return False
+        except Exception as e:
+            logger.exception("Unexpected error saving content for '%s'", folder_path)
             raise ContentGenerationError(str(e)) from e
 
     def _get_pending_folders(self, terms_dir: Path) -> list[Path]:
         """Get list of folders that need content generation."""
-        return [
-            path
-            for path in sorted(terms_dir.iterdir())
-            if path.is_dir() and self.persistence.needs_generation(path)
-        ]
+        with os.scandir(terms_dir) as entries:
+            pending = [
+                entry.path
+                for entry in entries
+                if entry.is_dir() and self.persistence.needs_generation(entry.path)
+            ]
+        # Only the (usually few) pending folders need sorting
+        return [Path(path) for path in sorted(pending)]
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedTerm:
     """A vocabulary term with AI-generated content."""
 
@@ -14,6 +14,19 @@ class GeneratedTerm:
     part_of_speech: str
     gender: Optional[str] = None
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "GeneratedTerm":
+        """Create from a JSON dictionary. Raises KeyError if a field is missing."""
+        return cls(
+            term=data["term"],
+            definitions=data["definitions"],
+            frequency_rating=data["frequency_rating"],
+            example_sentences=data["example_sentences"],
+            image_search_query=data["image_search_query"],
+            part_of_speech=data["part_of_speech"],
+            gender=data.get("gender"),
+        )
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         data = {
@@ -1,26 +1,38 @@
 """OpenAI API client for content generation."""
 
 import json
+import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
 from openai import OpenAI
 from openai.types.chat import ChatCompletion
 
+from spanish_flashcard_builder.cache import ResponseCache
 from spanish_flashcard_builder.config import api_keys, openai_config
 
 from .models import GeneratedTerm
 
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+logger = logging.getLogger(__name__)
+
 
 class OpenAIClient:
     def __init__(self) -> None:
-        self.client = OpenAI(api_key=api_keys.openai)
+        # The SDK retries rate limits, timeouts and 5xx errors with exponential
+        # backoff (honouring Retry-After), which keeps concurrent requests in check
+        self.client = OpenAI(
+            api_key=api_keys.openai, max_retries=openai_config.max_retries
+        )
         self.prompt_template = self._load_prompt_file("prompt_template.txt")
         self.system_instruction = self._load_prompt_file("system_instruction.txt")
 
-    def _load_prompt_file(self, filename: str) -> str:
-        prompt_path = Path(__file__).parent / "prompts" / filename
-        with open(prompt_path, "r") as f:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _load_prompt_file(filename: str) -> str:
+        with open(PROMPTS_DIR / filename, "r") as f:
             return f.read()
 
     def generate_term(
@@ -41,9 +53,20 @@ class OpenAIClient:
         content = response.choices[0].message.content
         if content is None:
             raise ValueError("OpenAI response content is None")
-        print(content)
+        logger.debug("Raw OpenAI response for '%s': %s", word, content)
         return self._parse_response(content)
 
+    def request_key(
+        self, word: str, part_of_speech: str, definitions: List[str]
+    ) -> str:
+        """Cache key for the request generate_term would send for a word."""
+        return ResponseCache.make_key(
+            openai_config.model,
+            str(openai_config.temperature),
+            self.system_instruction,
+            self._build_prompt(word, part_of_speech, definitions),
+        )
+
     def _build_prompt(
         self, word: str, part_of_speech: str, definitions: List[str]
     ) -> str:
@@ -54,16 +77,6 @@ class OpenAIClient:
 
     def _parse_response(self, response_text: str) -> GeneratedTerm:
         try:
-            data = json.loads(response_text)
-
-            return GeneratedTerm(
-                term=data["term"],
-                definitions=data["definitions"],
-                frequency_rating=data["frequency_rating"],
-                example_sentences=data["example_sentences"],
-                image_search_query=data["image_search_query"],
-                part_of_speech=data["part_of_speech"],
-                gender=data.get("gender", None),
-            )
+            return GeneratedTerm.from_dict(json.loads(response_text))
         except (json.JSONDecodeError, KeyError) as e:
             raise ValueError(f"Failed to parse OpenAI response: {e}") from e
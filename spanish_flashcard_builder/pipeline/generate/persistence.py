@@ -2,8 +2,9 @@
 
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
 from spanish_flashcard_builder.config import paths
 from spanish_flashcard_builder.exceptions import IoError
@@ -16,7 +17,9 @@ class ContentPersistence:
 
     def __init__(self) -> None:
         """Initialize the persistence manager."""
-        pass
+        # Precomputed so per-folder checks are plain string concatenation
+        self._dictionary_entry_suffix = os.sep + paths.dictionary_entry_filename
+        self._flashcard_suffix = os.sep + paths.flashcard_filename
 
     def save_content(self, folder_path: Path, term_data: Dict[str, Any]) -> bool:
         """Save generated content to file.
@@ -35,14 +38,16 @@ class ContentPersistence:
             output_path = folder_path / paths.flashcard_filename
             with open(output_path, "w", encoding="utf-8") as f:
                 json.dump(term_data, f, indent=2, ensure_ascii=False)
-            logger.info(f"Content saved to {output_path}")
+            logger.info("Content saved to %s", output_path)
             return True
 
         except Exception as e:
             raise IoError(f"Failed to save content: {e}") from e
 
-    def needs_generation(self, folder_path: Path) -> bool:
+    def needs_generation(self, folder_path: Union[str, Path]) -> bool:
         """Check if folder needs content generation."""
-        mw_path = folder_path / paths.dictionary_entry_filename
-        output_path = folder_path / paths.flashcard_filename
-        return mw_path.exists() and not output_path.exists()
+        folder = str(folder_path)
+        # Most folders are already generated, so rule those out with one stat
+        return not os.path.exists(folder + self._flashcard_suffix) and (
+            os.path.exists(folder + self._dictionary_entry_suffix)
+        )
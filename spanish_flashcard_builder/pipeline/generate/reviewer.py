@@ -3,48 +3,61 @@ import logging
 import os
 import subprocess
 import tempfile
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from spanish_flashcard_builder.exceptions import SpanishFlashcardError
 from spanish_flashcard_builder.utils import get_key_press
 
 
+class ContentEditError(SpanishFlashcardError):
+    """Raised when generated content could not be edited."""
+
+    pass
+
+
 class ContentReviewer:
     """Handles user review of generated content."""
 
-    def review_content(self, term_data: Dict[str, Any]) -> bool:
-        """Review generated content with user."""
+    def review_content(self, term_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Review generated content with user.
+
+        Returns the accepted (possibly edited) content, or None if rejected.
+        Raises ContentEditError if the editor fails or leaves invalid JSON.
+        """
         print("\nGenerated flashcard content:")
         print(json.dumps(term_data, indent=2, ensure_ascii=False))
         print("\nPress SPACE to continue, 'e' to edit, any other key to cancel")
 
         user_input = get_key_press()
         if user_input == " ":
-            return True
+            return term_data
         elif user_input == "e":
             logging.info("Opening editor for content review...")
             return self._edit_in_editor(term_data)
         else:
             logging.info("Content generation was cancelled by user")
-            return False
+            return None
 
-    def _edit_in_editor(self, data: Dict[str, Any]) -> bool:
+    def _edit_in_editor(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Edit JSON data in external editor."""
         editor = os.environ.get("EDITOR", "vim")
 
-        with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as tf:
+        with tempfile.NamedTemporaryFile(
+            suffix=".json", mode="w", encoding="utf-8", delete=False
+        ) as tf:
             json.dump(data, tf, indent=2, ensure_ascii=False)
             temp_path = tf.name
 
         try:
-            if subprocess.run([editor, temp_path]).returncode == 0:
-                with open(temp_path, encoding="utf-8") as f:
-                    edited_data = json.load(f)
-                data.clear()
-                data.update(edited_data)
-                return True
-            return False
+            returncode = subprocess.run([editor, temp_path]).returncode
+            if returncode != 0:
+                raise ContentEditError(f"Editor exited with status {returncode}")
+            with open(temp_path, encoding="utf-8") as f:
+                edited_data: Dict[str, Any] = json.load(f)
+            return edited_data
         except json.JSONDecodeError as e:
-            logging.error(f"Invalid JSON after editing: {e}")
-            return False
+            raise ContentEditError(f"Invalid JSON after editing: {e}") from e
+        except OSError as e:
+            raise ContentEditError(f"Could not run editor '{editor}': {e}") from e
         finally:
             os.unlink(temp_path)
@@ -5,9 +5,9 @@ from .selector import ImageSelector
 logging.basicConfig(level=logging.INFO)
 
 
-def main() -> None:
+def main(use_cache: bool = True) -> None:
     """Main entry point for the image selector."""
-    selector = ImageSelector()
+    selector = ImageSelector(use_cache=use_cache)
     selector.process_terms()
 
 
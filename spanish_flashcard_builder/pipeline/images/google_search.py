@@ -1,13 +1,16 @@
 """Google Custom Search API client for image search."""
 
+import json
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Union
+from typing import Any, Dict, List, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
-from spanish_flashcard_builder.config import api_keys
+from spanish_flashcard_builder.cache import ResponseCache
+from spanish_flashcard_builder.config import api_keys, paths
 from spanish_flashcard_builder.exceptions import SpanishFlashcardError
 
 
@@ -35,10 +38,26 @@ class GoogleImageSearch:
     """Client for Google Custom Search API focused on image search."""
 
     BASE_URL = "https://customsearch.googleapis.com/customsearch/v1"
+    # Results come from many hosts and are downloaded on several threads
+    MAX_POOLED_CONNECTIONS = 16
+    # Cached results older than this are searched again, since image URLs go stale
+    CACHE_MAX_AGE = 30 * 24 * 60 * 60  # seconds
 
-    def __init__(self) -> None:
+    def __init__(self, use_cache: bool = True) -> None:
         self.api_key = api_keys.google_search
         self.search_engine_id = api_keys.google_search_engine_id
+        # Searches count against the daily API quota, so results are kept a while
+        self.cache = ResponseCache(paths.image_search_cache, self.CACHE_MAX_AGE)
+        self.use_cache = use_cache
+
+        # Reuse connections (and TLS sessions) across searches and downloads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.MAX_POOLED_CONNECTIONS,
+            pool_maxsize=self.MAX_POOLED_CONNECTIONS,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def search_images(self, query: str, num_results: int = 10) -> List[ImageResult]:
         """Search for images using the provided query.
@@ -53,38 +72,54 @@ class GoogleImageSearch:
         Raises:
             ImageSearchError: If the search request fails
         """
+        num_results = min(num_results, 10)
+        cache_key = ResponseCache.make_key(
+            self.search_engine_id, query, str(num_results)
+        )
+        cached = self.cache.get(cache_key) if self.use_cache else None
+        if cached is not None:
+            try:
+                return self._parse_results(json.loads(cached))
+            except json.JSONDecodeError:
+                logging.warning("Ignoring corrupt cached results for '%s'", query)
+
         params: Dict[str, Union[str, int]] = {
             "key": self.api_key,
             "cx": self.search_engine_id,
             "q": query,
             "searchType": "image",
-            "num": min(num_results, 10),
+            "num": num_results,
             "rights": "cc_publicdomain,cc_attribute,cc_sharealike",
             "safe": "active",
             "imgSize": "large",
         }
 
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = self.session.get(self.BASE_URL, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
-
-            return [
-                ImageResult(
-                    title=item.get("title", ""),
-                    thumbnail_url=item.get("image", {}).get("thumbnailLink", ""),
-                    full_url=item.get("link", ""),
-                    width=item.get("image", {}).get("width", 0),
-                    height=item.get("image", {}).get("height", 0),
-                    file_format=item.get("image", {}).get("mime", "").split("/")[-1],
-                )
-                for item in data.get("items", [])
-            ]
-
         except RequestException as e:
-            logging.error(f"Failed to search for images: {e}")
+            logging.error("Failed to search for images: %s", e)
             raise ImageSearchError(f"Image search failed: {e}") from e
 
+        self.cache.put(cache_key, response.text)
+        return self._parse_results(data)
+
+    @staticmethod
+    def _parse_results(data: Dict[str, Any]) -> List[ImageResult]:
+        """Convert a search API response into ImageResult objects."""
+        return [
+            ImageResult(
+                title=item.get("title", ""),
+                thumbnail_url=item.get("image", {}).get("thumbnailLink", ""),
+                full_url=item.get("link", ""),
+                width=item.get("image", {}).get("width", 0),
+                height=item.get("image", {}).get("height", 0),
+                file_format=item.get("image", {}).get("mime", "").split("/")[-1],
+            )
+            for item in data.get("items", [])
+        ]
+
     def download_image(self, url: str) -> bytes:
         """Download an image from a URL.
 
@@ -98,10 +133,10 @@ class GoogleImageSearch:
             ImageSearchError: If the download fails
         """
         try:
-            response = requests.get(url, stream=True, timeout=10)
+            response = self.session.get(url, stream=True, timeout=10)
             response.raise_for_status()
             return response.content
 
         except RequestException as e:
-            logging.error(f"Failed to download image from {url}: {e}")
+            logging.error("Failed to download image from %s: %s", url, e)
             raise ImageSearchError(f"Image download failed: {e}") from e
@@ -3,8 +3,10 @@
 import concurrent.futures
 import logging
 import tkinter as tk
+from dataclasses import dataclass
+from io import BytesIO
 from tkinter import ttk
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, cast
 
 from PIL import Image, ImageTk
 
@@ -19,6 +21,9 @@ PREVIEW_SIZE: ImageSize = (300, 300)
 GRID_COLUMNS: int = 5
 PADDING: int = 20
 HEADER_HEIGHT: int = 250
+LOAD_POLL_INTERVAL_MS: int = 50
+# Number keys 1-9 select the first nine images, 0 selects the tenth
+SELECTION_KEYS: Dict[str, int] = {str((idx + 1) % 10): idx for idx in range(10)}
 
 TITLE_FONT: FontConfig = ("Arial", 18, "bold")
 SUBTITLE_FONT: FontConfig = ("Arial", 16)
@@ -34,6 +39,38 @@ NO_IMAGES_MSG: str = "No suitable image found, skipping."
 QUIT_MSG: str = "Quitting image selection."
 
 
+@dataclass(frozen=True)
+class LoadedImage:
+    """A downloaded image's bytes together with its grid preview.
+
+    Only the preview is decoded up front; the full image is decoded from the
+    bytes once it has been selected.
+    """
+
+    data: bytes
+    preview: Image.Image
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "LoadedImage":
+        """Build the preview. Meant to run on a worker, not the Tk thread."""
+        preview = Image.open(BytesIO(data))
+        preview.thumbnail(PREVIEW_SIZE, Image.Resampling.BILINEAR)
+        return cls(data, preview)
+
+    def open_image(self) -> Image.Image:
+        """Open the full-size image."""
+        return Image.open(BytesIO(self.data))
+
+
+ImageFuture = concurrent.futures.Future[Optional[LoadedImage]]
+
+
+def _get_loaded_image(future: ImageFuture) -> Optional[Image.Image]:
+    """Get the full-size image from a completed future."""
+    loaded = future.result()
+    return loaded.open_image() if loaded else None
+
+
 class ScrollableFrame:
     """A scrollable frame container with mouse wheel support."""
 
@@ -165,79 +202,96 @@ class ImageGrid:
         self.frame: ttk.Frame = ttk.Frame(parent)
         self.on_select: OnSelectCallback = on_select
         self.image_refs: List[ImageTk.PhotoImage] = []  # Prevent garbage collection
+        self.slot_frames: Dict[int, ttk.Frame] = {}  # Reused across terms
         self.loading_labels: Dict[int, ttk.Label] = {}  # Track loading indicators
         self.image_labels: Dict[int, ttk.Label] = {}  # Track image labels
-        self.futures: List[concurrent.futures.Future[Optional[Image.Image]]] = []
-
-    def display_futures(
-        self, futures: List[concurrent.futures.Future[Optional[Image.Image]]]
-    ) -> None:
-        """Display loading states and set up future callbacks."""
+        self.futures: List[ImageFuture] = []
+        self.pending_indices: Set[int] = set()  # Futures not yet displayed
+        self.poll_job: Optional[str] = None
+
+    def display_futures(self, futures: List[ImageFuture]) -> None:
+        """Display loading states and poll futures until they're loaded."""
+        if self.poll_job is not None:
+            self.frame.after_cancel(self.poll_job)
+            self.poll_job = None
         self.futures = futures
+        self.pending_indices = set(range(len(futures)))
+
+        # Reset the slots in use back to their loading state, hide the rest
+        for idx in range(len(futures)):
+            if idx not in self.slot_frames:
+                self._create_slot(idx)
+            self.slot_frames[idx].grid()
+            self.image_labels[idx].configure(image="")
+            self.loading_labels[idx].configure(text="Loading...")
+            self.loading_labels[idx].pack(before=self.image_labels[idx])
+        for idx, frame in self.slot_frames.items():
+            if idx >= len(futures):
+                frame.grid_remove()
         self.image_refs.clear()
 
-        # Clear existing grid
-        for widget in self.frame.winfo_children():
-            widget.destroy()
-        self.loading_labels.clear()
-        self.image_labels.clear()
-
-        # Create grid slots for each future
-        for idx, future in enumerate(futures):
-            frame = ttk.Frame(self.frame)
-            row = (idx // GRID_COLUMNS) + 1
-            col = idx % GRID_COLUMNS
-            frame.grid(row=row, column=col, padx=10, pady=10)
-
-            # Add number label
-            display_number = "0" if idx == 9 else str(idx + 1)
-            number_label = ttk.Label(frame, text=display_number, font=BODY_FONT)
-            number_label.pack()
-
-            # Add loading indicator
-            loading_label = ttk.Label(frame, text="Loading...", font=ITALIC_FONT)
-            loading_label.pack()
-            self.loading_labels[idx] = loading_label
-
-            # Create empty image label
-            img_label = ttk.Label(frame)
-            img_label.pack()
-            self.image_labels[idx] = img_label
-
-            # Set up callback for when future completes
-            def make_callback(
-                index: int,
-            ) -> Callable[[concurrent.futures.Future[Optional[Image.Image]]], None]:
-                return lambda f: self._handle_loaded_image(f, index)
-
-            future.add_done_callback(make_callback(idx))
-
-            def click_handler(
-                e: tk.Event,
-                index: int = idx,
-                bound_future: concurrent.futures.Future[Optional[Image.Image]] = future,
-            ) -> None:
-                if bound_future.done():
-                    self.on_select(index, bound_future.result())
-                    e.widget.winfo_toplevel().quit()
-
-            for widget in (frame, number_label, img_label):
-                widget.bind("<Button-1>", click_handler)
-
-    def _handle_loaded_image(
-        self, future: concurrent.futures.Future[Optional[Image.Image]], idx: int
-    ) -> None:
+        self._poll_futures()
+
+    def _create_slot(self, idx: int) -> None:
+        """Create the widgets for one grid position."""
+        frame = ttk.Frame(self.frame)
+        row = (idx // GRID_COLUMNS) + 1
+        col = idx % GRID_COLUMNS
+        frame.grid(row=row, column=col, padx=10, pady=10)
+        self.slot_frames[idx] = frame
+
+        # Add number label
+        display_number = "0" if idx == 9 else str(idx + 1)
+        number_label = ttk.Label(frame, text=display_number, font=BODY_FONT)
+        number_label.pack()
+
+        # Add loading indicator
+        loading_label = ttk.Label(frame, text="Loading...", font=ITALIC_FONT)
+        loading_label.pack()
+        self.loading_labels[idx] = loading_label
+
+        # Create empty image label
+        img_label = ttk.Label(frame)
+        img_label.pack()
+        self.image_labels[idx] = img_label
+
+        def click_handler(e: tk.Event, index: int = idx) -> None:
+            # Look the future up on click, since slots outlive each search
+            future = self.futures[index]
+            if future.done():
+                self.on_select(index, _get_loaded_image(future))
+                e.widget.winfo_toplevel().quit()
+
+        for widget in (frame, number_label, img_label):
+            widget.bind("<Button-1>", click_handler)
+
+    def _poll_futures(self) -> None:
+        """Display finished images, rescheduling while any are still loading.
+
+        Futures complete on worker threads, but Tk widgets may only be touched
+        from the Tk thread, so completion is polled from the event loop.
+        """
+        for idx in sorted(self.pending_indices):
+            if self.futures[idx].done():
+                self.pending_indices.discard(idx)
+                self._handle_loaded_image(self.futures[idx], idx)
+
+        self.poll_job = (
+            self.frame.after(LOAD_POLL_INTERVAL_MS, self._poll_futures)
+            if self.pending_indices
+            else None
+        )
+
+    def _handle_loaded_image(self, future: ImageFuture, idx: int) -> None:
         """Handle a completed image load."""
         try:
-            if img := future.result():
-                # Remove loading indicator
+            if loaded := future.result():
+                # Hide loading indicator
                 if loading_label := self.loading_labels.get(idx):
-                    loading_label.destroy()
+                    loading_label.pack_forget()
 
                 # Display image
-                preview_image = img.copy()
-                preview_image.thumbnail(PREVIEW_SIZE, Image.Resampling.LANCZOS)
-                photo_image = ImageTk.PhotoImage(preview_image)
+                photo_image = ImageTk.PhotoImage(loaded.preview)
                 self.image_refs.append(photo_image)
 
                 if img_label := self.image_labels.get(idx):
@@ -247,7 +301,7 @@ class ImageGrid:
                 if loading_label := self.loading_labels.get(idx):
                     loading_label.configure(text="Failed to load")
         except Exception as e:
-            logging.error(f"Error handling loaded image: {e}")
+            logging.error("Error handling loaded image: %s", e)
             if loading_label := self.loading_labels.get(idx):
                 loading_label.configure(text="Error")
 
@@ -331,9 +385,7 @@ class ImageSelectorGUI:
         self.term_info = TermInfoPanel(self.term_frame, term_data, self.on_search)
         self.term_info.grid(sticky="ew")
 
-    def update_image_futures(
-        self, futures: List[concurrent.futures.Future[Optional[Image.Image]]]
-    ) -> None:
+    def update_image_futures(self, futures: List[ImageFuture]) -> None:
         """Update the display with new image futures."""
         if self.image_grid:
             self.image_grid.display_futures(futures)
@@ -363,19 +415,12 @@ class ImageSelectorGUI:
         elif key == "q":
             self.on_quit()
             self.root.quit()
-        elif key in "123456789":
-            idx = int(key) - 1
+        elif (idx := SELECTION_KEYS.get(key)) is not None:
             # Only allow selection if image is loaded
             if self.image_grid and idx < len(self.image_grid.futures):
                 future = self.image_grid.futures[idx]
                 if future.done():
-                    self.on_select(idx, future.result())
-                    self.root.quit()
-        elif key == "0":  # Handle 0 as the 10th image
-            if self.image_grid and len(self.image_grid.futures) > 9:
-                future = self.image_grid.futures[9]
-                if future.done():
-                    self.on_select(9, future.result())
+                    self.on_select(idx, _get_loaded_image(future))
                     self.root.quit()
 
     def _on_close(self) -> None:
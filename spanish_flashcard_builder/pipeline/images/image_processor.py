@@ -22,17 +22,17 @@ class ImageProcessor:
         try:
             processed = image.copy()
             original_dims = processed.size
-            logging.debug(f"Original image dimensions: {original_dims}")
+            logging.debug("Original image dimensions: %s", original_dims)
 
             # Ensure image is in a format that supports RGBA
             if processed.mode not in ("RGB", "RGBA"):
-                logging.info(f"Converting image from {processed.mode} to RGB")
+                logging.info("Converting image from %s to RGB", processed.mode)
                 processed = processed.convert("RGB")
 
             processed.thumbnail(
                 (self.max_dimension, self.max_dimension), Image.Resampling.LANCZOS
             )
-            logging.debug(f"Resized image dimensions: {processed.size}")
+            logging.debug("Resized image dimensions: %s", processed.size)
 
             # Ensure parent directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -40,33 +40,31 @@ class ImageProcessor:
             try:
                 processed.save(output_path, "PNG")
             except Exception as e:
-                logging.error(f"Failed to save image: {str(e)}")
+                logging.error("Failed to save image: %s", e)
                 return None
 
             if not output_path.exists():
-                logging.error(f"Image file was not created at {output_path}")
+                logging.error("Image file was not created at %s", output_path)
                 return None
 
             try:
                 # Verify the saved image can be loaded
                 Image.open(output_path)
             except Exception as e:
-                logging.error(f"Saved image is corrupted: {str(e)}")
+                logging.error("Saved image is corrupted: %s", e)
                 if output_path.exists():
                     output_path.unlink()
                 return None
 
             result = ProcessedImage(output_path, original_dims)
-            logging.debug(f"Successfully created ProcessedImage: {result}")
+            logging.debug("Successfully created ProcessedImage: %s", result)
             return result
 
         except Exception as e:
-            logging.error(f"Failed to process image: {str(e)}", exc_info=True)
+            logging.error("Failed to process image: %s", e, exc_info=True)
             if output_path.exists():
                 try:
                     output_path.unlink()
                 except Exception as del_e:
-                    logging.error(
-                        f"Failed to delete corrupted output file: {str(del_e)}"
-                    )
+                    logging.error("Failed to delete corrupted output file: %s", del_e)
             return None
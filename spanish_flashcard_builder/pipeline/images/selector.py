@@ -3,20 +3,29 @@
 import concurrent.futures
 import json
 import logging
-from io import BytesIO
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-import requests
 from PIL import Image
 
 from spanish_flashcard_builder.config import image_config, paths
 
 from .google_search import GoogleImageSearch, ImageResult, ImageSearchError
-from .gui import ImageSelectorGUI
+from .gui import ImageFuture, ImageSelectorGUI, LoadedImage
 from .image_processor import ImageProcessor
 
 
+@dataclass(frozen=True)
+class _PreparedTerm:
+    """A term whose image search has been run and downloads started."""
+
+    term_data: Dict[str, Any]
+    results: List[ImageResult]
+    loading_futures: List[ImageFuture]
+
+
 class ImageSelector:
     """Manages image selection workflow for vocabulary terms.
 
@@ -24,38 +33,38 @@ class ImageSelector:
     displaying options to user, and saving selected images.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, use_cache: bool = True) -> None:
         """Initialize with term data."""
-        self.search_client = GoogleImageSearch()
+        self.search_client = GoogleImageSearch(use_cache=use_cache)
         self.current_results: List[ImageResult] = []
         self.selected_index: Optional[int] = None
         self.gui: Optional[ImageSelectorGUI] = None
         self.terms_dir = paths.terms_dir
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
-        self.loading_futures: List[
-            concurrent.futures.Future[Optional[Image.Image]]
-        ] = []
+        # Searches for the next term while the user picks an image
+        self.prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.loading_futures: List[ImageFuture] = []
 
     def _load_augmented_term(self, term_dir: Path) -> Optional[Dict[str, Any]]:
         """Load the augmented term data from a term directory."""
         try:
             augmented_file = term_dir / paths.flashcard_filename
             if not augmented_file.exists():
-                logging.warning(f"No augmented term file found in {term_dir}")
+                logging.warning("No augmented term file found in %s", term_dir)
                 return None
 
             with open(augmented_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
                 if not isinstance(data, dict):
-                    logging.error(f"Invalid JSON format in {term_dir}: expected dict")
+                    logging.error("Invalid JSON format in %s: expected dict", term_dir)
                     return None
                 return data
         except json.JSONDecodeError as e:
-            logging.error(f"Error parsing augmented term file in {term_dir}: {e}")
+            logging.error("Error parsing augmented term file in %s: %s", term_dir, e)
             return None
         except Exception as e:
             logging.error(
-                f"Unexpected error loading augmented term from {term_dir}: {e}"
+                "Unexpected error loading augmented term from %s: %s", term_dir, e
             )
             return None
 
@@ -63,64 +72,73 @@ class ImageSelector:
         """Get directories of vocabulary terms that still need images."""
         terms_path = Path(self.terms_dir)
         if not terms_path.exists():
-            logging.error(f"Terms directory not found: {terms_path}")
+            logging.error("Terms directory not found: %s", terms_path)
             return []
 
         pending_dirs = []
-        for term_dir in terms_path.iterdir():
-            if not term_dir.is_dir():
-                continue
+        with os.scandir(terms_path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
 
-            image_path = term_dir / paths.get_image_filename(term_dir)
-            if not image_path.exists():
-                pending_dirs.append(term_dir)
-            else:
-                logging.debug(f"Skipping {term_dir.name}: image already exists")
+                image_filename = paths.get_image_filename(Path(entry.name))
+                if not os.path.exists(os.path.join(entry.path, image_filename)):
+                    pending_dirs.append(entry.path)
+                else:
+                    logging.debug("Skipping %s: image already exists", entry.name)
 
-        return pending_dirs
-
-    def _fetch_image(self, url: str) -> Optional[bytes]:
-        try:
-            response = requests.get(url, timeout=(1.5, 3))
-            response.raise_for_status()
-            return response.content
-        except Exception as e:
-            logging.error(f"Failed to fetch image from {url}: {e}")
-            return None
+        return [Path(path) for path in sorted(pending_dirs)]
 
-    def _load_image_async(
-        self, result: ImageResult
-    ) -> concurrent.futures.Future[Optional[Image.Image]]:
+    def _load_image_async(self, result: ImageResult) -> ImageFuture:
         """Start async loading of an image."""
         return self.executor.submit(self._load_image, result)
 
-    def _load_image(self, result: ImageResult) -> Optional[Image.Image]:
-        """Load a single image."""
+    def _load_image(self, result: ImageResult) -> Optional[LoadedImage]:
+        """Download a single image and build its preview."""
         try:
-            response = requests.get(result.full_url, stream=True, timeout=10)
-            response.raise_for_status()
-            return Image.open(BytesIO(response.content))
+            image_bytes = self.search_client.download_image(result.full_url)
+            return LoadedImage.from_bytes(image_bytes)
         except Exception as e:
-            logging.error(f"Failed to load image from {result.full_url}: {e}")
+            logging.error("Failed to load image from %s: %s", result.full_url, e)
             return None
 
-    def _handle_search(self, query: str) -> None:
-        """Handle new search request."""
-        logging.info(f"Searching for '{query}'...")
+    def _start_search(self, query: str) -> Tuple[List[ImageResult], List[ImageFuture]]:
+        """Search for images and start loading them."""
+        logging.info("Searching for '%s'...", query)
+        results = self.search_client.search_images(query)
+        futures = [
+            self._load_image_async(result)
+            for result in results[:10]  # Limit to first 10 images
+        ]
+        return results, futures
+
+    def _prepare_term(self, term_dir: Path) -> Optional[_PreparedTerm]:
+        """Load a term and start its image search."""
+        if not (term_data := self._load_augmented_term(term_dir)):
+            return None
 
         try:
-            self.current_results = self.search_client.search_images(query)
-
-            # Start async loading and update GUI
-            self.loading_futures = [
-                self._load_image_async(result)
-                for result in self.current_results[:10]  # Limit to first 10 images
-            ]
-            if self.gui:
-                self.gui.update_image_futures(self.loading_futures)
+            results, futures = self._start_search(term_data["image_search_query"])
+        except ImageSearchError as e:
+            logging.error("Error during image search: %s", e)
+            results, futures = [], []
+        return _PreparedTerm(term_data, results, futures)
+
+    def _show_results(
+        self, results: List[ImageResult], futures: List[ImageFuture]
+    ) -> None:
+        """Make search results current and display them."""
+        self.current_results = results
+        self.loading_futures = futures
+        if self.gui:
+            self.gui.update_image_futures(self.loading_futures)
 
+    def _handle_search(self, query: str) -> None:
+        """Handle new search request."""
+        try:
+            self._show_results(*self._start_search(query))
         except ImageSearchError as e:
-            logging.error(f"Error during image search: {e}")
+            logging.error("Error during image search: %s", e)
             self.current_results = []
 
     def _handle_select(self, index: int, image: Optional[Image.Image]) -> None:
@@ -139,23 +157,18 @@ class ImageSelector:
         self.selected_index = None
         logging.info("Quit image selection")
 
-    def _search_images_for_term(
-        self, term_dir: Path, term_data: Dict[str, Any]
-    ) -> Optional[List[ImageResult]]:
-        """Search for images based on the term data."""
-        logging.info(f"Searching for images matching term '{term_dir.name}'")
-        results = self.search_client.search_images(term_data["image_search_query"])
-
-        if not results:
-            logging.warning(f"No images found for term {term_dir.name}")
-            return None
-
-        images = {}
-        for i, result in enumerate(results[:10]):
-            if img_bytes := self._fetch_image(result.full_url):
-                images[i] = img_bytes
-
-        return results if images else None
+    def _iter_prepared_terms(
+        self, term_dirs: List[Path]
+    ) -> Iterator[Tuple[Path, Optional[_PreparedTerm]]]:
+        """Yield terms in order, preparing each one while the previous is shown."""
+        next_term = self.prefetch_executor.submit(self._prepare_term, term_dirs[0])
+        for index, term_dir in enumerate(term_dirs):
+            prepared = next_term.result()
+            if index + 1 < len(term_dirs):
+                next_term = self.prefetch_executor.submit(
+                    self._prepare_term, term_dirs[index + 1]
+                )
+            yield term_dir, prepared
 
     def process_terms(self) -> None:
         """Process all vocabulary terms that need images."""
@@ -175,15 +188,15 @@ class ImageSelector:
         )
 
         try:
-            for term_dir in pending_terms:
-                if term_data := self._load_augmented_term(term_dir):
-                    # Initial search and update GUI
-                    self._handle_search(term_data["image_search_query"])
+            for term_dir, prepared in self._iter_prepared_terms(pending_terms):
+                if prepared:
+                    # Initial search results and update GUI
+                    self._show_results(prepared.results, prepared.loading_futures)
                     if not self.current_results:
                         continue
 
                     if self.gui:
-                        self.gui.update_term(term_data)
+                        self.gui.update_term(prepared.term_data)
                         self.gui.run()
 
                     # Handle selection result
@@ -201,4 +214,5 @@ class ImageSelector:
             if self.gui:
                 self.gui.destroy()
                 self.gui = None
-            self.executor.shutdown(wait=False)
+            self.prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self.executor.shutdown(wait=False, cancel_futures=True)
@@ -1,17 +1,34 @@
 import argparse
 import glob
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List
 
-from spanish_flashcard_builder.config import paths
+# Static so the CLI can list components without loading the path config, which
+# creates the data and output directories
+TARGETS = (
+    "flashcard-data",
+    "dictionary-entry",
+    "images",
+    "audio",
+    "image-search-cache",
+    "all",  # Special case handled in clean function
+)
 
-TARGETS: Dict[str, Optional[str]] = {
-    "flashcard-data": paths.flashcard_filename,
-    "dictionary-entry": paths.dictionary_entry_filename,
-    "images": "*.png",
-    "audio": "*.mp3",
-    "all": None,  # Special case handled in clean function
-}
+
+def _get_patterns() -> Dict[str, str]:
+    """Glob patterns for the files removed by each target."""
+    from spanish_flashcard_builder.config import paths
+
+    def term_files(pattern: str) -> str:
+        return os.path.join(paths.terms_dir, "*", pattern)
+
+    return {
+        "flashcard-data": term_files(paths.flashcard_filename),
+        "dictionary-entry": term_files(paths.dictionary_entry_filename),
+        "images": term_files("*.png"),
+        "audio": term_files("*.mp3"),
+        "image-search-cache": os.path.join(paths.image_search_cache, "*"),
+    }
 
 
 def _remove_files(files: List[str]) -> None:
@@ -33,23 +50,21 @@ def clean(component: str) -> None:
             - "images": Remove image files
             - "dictionary-entries": Remove dictionary entries
             - "flashcard-data": Remove generated flashcard data
+            - "image-search-cache": Remove cached Google image search results
             - "all": Remove all generated files
     """
     if component == "all":
-        for target, _pattern in TARGETS.items():
+        for target in TARGETS:
             if target != "all":
                 clean(target)
         return
 
     if component not in TARGETS:
         print(f"Unknown component: {component}")
-        print("Valid components:", ", ".join(TARGETS.keys()))
+        print("Valid components:", ", ".join(TARGETS))
         return
 
-    pattern = TARGETS[component]
-    if pattern is None:
-        return
-    files = glob.glob(os.path.join(paths.terms_dir, "*", pattern))
+    files = glob.glob(_get_patterns()[component])
     _remove_files(files)
 
 
@@ -57,7 +72,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Remove component data")
     parser.add_argument(
         "component",
-        choices=list(TARGETS.keys()),
+        choices=TARGETS,
         help="Target type to remove",
     )
     parser.add_argument(
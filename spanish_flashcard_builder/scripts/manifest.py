@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Callable, List, Union
+from typing import Callable, List, Set, Union
 
 from spanish_flashcard_builder.config import paths
 
@@ -27,30 +27,27 @@ def bold(text: str) -> str:
     return f"{BOLD_START}{text}{BOLD_END}"
 
 
-def check_pipeline_stage(vocab_path: str, filename: str) -> bool:
+def check_pipeline_stage(vocab_files: Set[str], filename: str) -> bool:
     """Check if a pipeline stage exists for a vocabulary item."""
-    return os.path.exists(os.path.join(vocab_path, filename))
+    return filename in vocab_files
 
 
 def check_media_stage(
-    vocab_path: Path, get_filename_func: Callable[[Path], Union[str, Path]]
+    vocab_path: Path,
+    vocab_files: Set[str],
+    get_filename_func: Callable[[Path], Union[str, Path]],
 ) -> bool:
     """Check if a media stage exists using the filename function."""
     try:
-        return (vocab_path / get_filename_func(vocab_path)).exists()
+        return str(get_filename_func(vocab_path)) in vocab_files
     except Exception:
         return False
 
 
 def get_vocab_dirs() -> List[str]:
     """Get sorted list of vocabulary directories."""
-    return sorted(
-        [
-            d
-            for d in os.listdir(paths.terms_dir)
-            if os.path.isdir(os.path.join(paths.terms_dir, d))
-        ]
-    )
+    with os.scandir(paths.terms_dir) as entries:
+        return sorted(entry.name for entry in entries if entry.is_dir())
 
 
 def _is_valid_file(file_path: str) -> bool:
@@ -85,13 +82,15 @@ def main() -> None:
     # Print each word's status
     for vocab_dir in vocab_dirs:
         vocab_path = Path(os.path.join(paths.terms_dir, vocab_dir))
+        # One directory listing answers every stage check for this word
+        vocab_files = set(os.listdir(vocab_path))
         print(HEADER_FORMAT.format(vocab_dir), end="")
 
         # Check regular pipeline stages
         for _, filename in PIPELINE_STAGES.items():
             symbol = (
                 PIPELINE_EXISTS_SYMBOL
-                if check_pipeline_stage(str(vocab_path), filename)
+                if check_pipeline_stage(vocab_files, filename)
                 else PIPELINE_MISSING_SYMBOL
             )
             print(PIPELINE_FORMAT.format(symbol), end="")
@@ -99,7 +98,9 @@ def main() -> None:
         # Check audio
         symbol = (
             PIPELINE_EXISTS_SYMBOL
-            if check_media_stage(vocab_path, paths.get_pronunciation_filename)
+            if check_media_stage(
+                vocab_path, vocab_files, paths.get_pronunciation_filename
+            )
             else PIPELINE_MISSING_SYMBOL
         )
         print(PIPELINE_FORMAT.format(symbol), end="")
@@ -107,7 +108,7 @@ def main() -> None:
         # Check image
         symbol = (
             PIPELINE_EXISTS_SYMBOL
-            if check_media_stage(vocab_path, paths.get_image_filename)
+            if check_media_stage(vocab_path, vocab_files, paths.get_image_filename)
             else PIPELINE_MISSING_SYMBOL
         )
         print(PIPELINE_FORMAT.format(symbol), end="")
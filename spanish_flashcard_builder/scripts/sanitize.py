@@ -1,15 +1,23 @@
 #!/usr/bin/env python3
 
 import sys
-from collections import defaultdict
-from typing import Optional
+from typing import Dict, Optional, Set
 
 import spacy
+from spacy.tokens import Doc
 
 from spanish_flashcard_builder.config import paths, spacy_config
 
 nlp: Optional[spacy.Language] = None
 
+# Words are tagged in batches to amortize spaCy's per-call overhead
+SPACY_BATCH_SIZE = 1000
+# Only part-of-speech tags and lemmas are used, so skip the components that
+# analyze sentence structure and named entities
+SPACY_EXCLUDED_COMPONENTS = ["parser", "ner"]
+# Parts of speech worth making flashcards for
+ALLOWED_POS = frozenset({"NOUN", "VERB", "ADJ", "ADV"})
+
 
 def load_spacy_model() -> spacy.Language:
     """
@@ -23,7 +31,7 @@ def load_spacy_model() -> spacy.Language:
     """
     global nlp
     try:
-        nlp = spacy.load(spacy_config.model_name)
+        nlp = spacy.load(spacy_config.model_name, exclude=SPACY_EXCLUDED_COMPONENTS)
     except OSError:
         print(f"Error: Spanish language model '{spacy_config.model_name}' not found.")
         response = input("Would you like to download it now? [Y/n] ").strip().lower()
@@ -40,28 +48,11 @@ def load_spacy_model() -> spacy.Language:
     return nlp
 
 
-def canonicalize_word(word: str) -> Optional[str]:
-    """
-    Convert a word to its canonical form using spaCy lemmatization.
-    Only returns words that exist in the Spanish vocabulary.
-
-    Args:
-        word: String containing the word to canonicalize
-
-    Returns:
-        Lemmatized form of the word if it's a valid Spanish word and part of speech,
-        None otherwise
-    """
-    global nlp
-    if nlp is None:
-        nlp = load_spacy_model()
-
-    doc = nlp(word)
-    allowed_pos = {"NOUN", "VERB", "ADJ", "ADV"}
-
+def _get_lemma(doc: Doc) -> Optional[str]:
+    """Get the lemma of the first valid Spanish word in a processed doc."""
     for token in doc:
         # Check if the word exists in Spanish vocabulary
-        if not token.is_oov and token.pos_ in allowed_pos:
+        if not token.is_oov and token.pos_ in ALLOWED_POS:
             return str(token.lemma_)
     return None
 
@@ -69,65 +60,51 @@ def canonicalize_word(word: str) -> Optional[str]:
 def process_vocab_file() -> None:
     """Process the raw vocabulary file and output cleaned version"""
 
-    lemma_dict = defaultdict(set)
-    # Keep track of first occurrence of each lemma
-    lemma_order = []
+    # Forms seen for each lemma, in order of each lemma's first occurrence
+    lemma_dict: Dict[str, Set[str]] = {}
 
     print("Loading spaCy model...")
-    load_spacy_model()
+    model = load_spacy_model()
     print("Sanitizing vocabulary file...")
 
-    # First count total lines for progress calculation
-    total_lines = sum(1 for _ in open(paths.raw_vocab, "r", encoding="utf-8"))
-
-    # Read and process the raw vocabulary file
+    # Read the unique words from the raw vocabulary file, in order of first
+    # appearance, keeping the first word on each line
     with open(paths.raw_vocab, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f, 1):
-            # Show progress every 100 lines
-            if i % 100 == 0:
-                progress = (i / total_lines) * 100
-                print(
-                    f"\rProgress: {progress:.1f}% ({i}/{total_lines} words)",
-                    end="",
-                    flush=True,
-                )
-
-            word = line.split()[0].strip().lower()
-
-            if not word:
-                continue
+        words = list(
+            dict.fromkeys(fields[0].lower() for line in f if (fields := line.split()))
+        )
+    total_words = len(words)
+
+    # Process the words through spaCy in batches
+    docs = model.pipe(words, batch_size=SPACY_BATCH_SIZE)
+    for i, (word, doc) in enumerate(zip(words, docs, strict=True), 1):
+        # Show progress every 100 words
+        if i % 100 == 0:
+            progress = (i / total_words) * 100
+            print(
+                f"\rProgress: {progress:.1f}% ({i}/{total_words} words)",
+                end="",
+                flush=True,
+            )
 
-            lemma = canonicalize_word(word)
-            if lemma is None:
-                continue
+        lemma = _get_lemma(doc)
+        if lemma is None:
+            continue
 
-            if lemma not in lemma_dict:
-                lemma_order.append(lemma)
-            lemma_dict[lemma].add(word)
+        if (forms := lemma_dict.get(lemma)) is None:
+            lemma_dict[lemma] = {word}
+        else:
+            forms.add(word)
 
     # Clear the progress message
     print("\r" + " " * 50 + "\r", end="", flush=True)
     print("Writing sanitized vocabulary file...")
 
-    # Write the sanitized vocabulary file
-    total_lemmas = len(lemma_order)
-
+    # Write the sanitized vocabulary file, using the shortest form of each lemma
+    lines = [min(forms, key=len) + "\n" for forms in lemma_dict.values()]
     with open(paths.sanitized_vocab, "w", encoding="utf-8") as f:
-        for i, lemma in enumerate(lemma_order, 1):
-            if i % 100 == 0:
-                progress = (i / total_lemmas) * 100
-                print(
-                    f"\rWriting: {progress:.1f}% ({i}/{total_lemmas} lemmas)",
-                    end="",
-                    flush=True,
-                )
-
-            forms = lemma_dict[lemma]
-            word_to_write = min(forms, key=len) if forms else lemma
-            f.write(f"{word_to_write}\n")
-
-    # Clear the writing progress message
-    print("\r" + " " * 50 + "\r", end="", flush=True)
+        f.writelines(lines)
+
     print(f"Processed {len(lemma_dict)} unique lemmas")
     print(f"Output written to {paths.sanitized_vocab}")
 
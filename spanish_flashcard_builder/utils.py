@@ -1,19 +1,19 @@
-import os
 import sys
-from typing import Any, cast
 
+# The implementation is picked once at import rather than on every keypress
+if sys.platform == "win32":
+    import msvcrt
 
-def get_key_press() -> str:
-    """Gets single keypress from the user."""
-    if os.name == "nt":
-        import msvcrt
+    def get_key_press() -> str:
+        """Gets single keypress from the user."""
+        return msvcrt.getch().decode()
 
-        msvcrt_any = cast(Any, msvcrt)
-        return cast(str, msvcrt_any.getch().decode())
-    else:
-        import termios
-        import tty
+else:
+    import termios
+    import tty
 
+    def get_key_press() -> str:
+        """Gets single keypress from the user."""
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
         try: